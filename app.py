@@ -1,13 +1,15 @@
 import streamlit as st
 from streamlit_gsheets import GSheetsConnection
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 import altair as alt
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 
 # --- CONFIG ---
 st.set_page_config(page_title="Bet Tracker", layout="wide")
-local_tz = pytz.timezone("America/New_York")
+local_tz = ZoneInfo("America/New_York")
 now_local = datetime.now(local_tz)
 
 # Initialize Session States
@@ -15,8 +17,16 @@ if "sticky_date" not in st.session_state:
     st.session_state.sticky_date = (now_local - timedelta(days=1)).date()
 if "staged_bets" not in st.session_state:
     st.session_state.staged_bets = []
+if "staged_pending" not in st.session_state:
+    st.session_state.staged_pending = []
 
 # --- NORMALIZATION ENGINE ---
+def to_money(col):
+    # Columns that are already float (e.g. staged rows built in-app) skip the to_numeric parse
+    if not pd.api.types.is_float_dtype(col):
+        col = pd.to_numeric(col, errors='coerce')
+    return col.fillna(0.0).astype(float)
+
 def normalize_dataframe(df, sheet_type="transactions"):
     if df.empty:
         if sheet_type == "transactions":
@@ -24,83 +34,203 @@ def normalize_dataframe(df, sheet_type="transactions"):
         else:
             return pd.DataFrame(columns=["event_date", "book", "amount_risked", "odds", "potential_pnl", "status"])
     
-    df = df.copy()
-    df['event_date'] = pd.to_datetime(df['event_date'], errors='coerce').dt.strftime('%Y-%m-%d')
-    df['book'] = df['book'].astype(str).str.strip().str.title()
+    # Shallow is enough: every touched column is reassigned whole, never written in place
+    df = df.copy(deep=False)
+    # Dates stay datetime64 in memory (int64 sorts/compares, no re-parse downstream);
+    # df_to_values formats them back to the sheet's text only when rows are written
+    df['event_date'] = pd.to_datetime(df['event_date'], errors='coerce').dt.normalize().astype('datetime64[s]')
+    df['book'] = df['book'].astype('string').str.strip().str.title()
     
     if sheet_type == "transactions":
         df['timeframe_type'] = df['timeframe_type'].astype(str).str.strip().str.lower()
-        df['total_won'] = pd.to_numeric(df['total_won'], errors='coerce').fillna(0.0).astype(float)
-        df['last_updated'] = pd.to_datetime(df['last_updated'], errors='coerce').fillna(pd.Timestamp.now()).dt.strftime('%Y-%m-%d %H:%M:%S')
+        df['total_won'] = to_money(df['total_won'])
+        df['last_updated'] = pd.to_datetime(df['last_updated'], errors='coerce').fillna(pd.Timestamp.now()).astype('datetime64[s]')
     else:
-        df['amount_risked'] = pd.to_numeric(df['amount_risked'], errors='coerce').fillna(0.0).astype(float)
-        df['potential_pnl'] = pd.to_numeric(df['potential_pnl'], errors='coerce').fillna(0.0).astype(float)
+        df['amount_risked'] = to_money(df['amount_risked'])
+        df['odds'] = pd.to_numeric(df['odds'], errors='coerce')
+        # The stored payout wins (parlays, boosts, hand edits); only blank cells are derived from stake and odds
+        derived = pd.Series(calc_pnl_vec(df['amount_risked'], df['odds'].to_numpy(dtype=float, na_value=np.nan)), index=df.index)
+        df['potential_pnl'] = pd.to_numeric(df['potential_pnl'], errors='coerce').fillna(derived).fillna(0.0).astype(float)
         df['status'] = df['status'].astype(str).str.strip().str.lower()
     return df
 
+def calc_pnl_vec(risk, odds):
+    # Branchless payout over whole columns in one ufunc pass; 0.0 where odds == 0
+    r, o = np.asarray(risk, dtype=float), np.asarray(odds, dtype=float)
+    return r * np.where(o > 0, o / 100, 100 / np.where(o < 0, -o, np.inf))
+
 def calc_pnl(risk, odds):
-    try:
-        r, o = float(risk), float(odds)
-        if o > 0: return r * (o / 100)
-        elif o < 0: return r * (100 / abs(o))
-    except: return 0.0
-    return 0.0
+    # Scalar path for form submits; st.number_input already guarantees numeric inputs
+    return risk * (odds / 100 if odds > 0 else -100 / odds) if odds else 0.0
+
+LEDGER_MONEY = pd.ArrowDtype(pa.decimal128(12, 2))
+SHEET_DATETIME_FORMATS = {'event_date': '%Y-%m-%d', 'last_updated': '%Y-%m-%d %H:%M:%S'}
+# Raw numbers (a NUMBER-formatted "1,250.00" won't parse), dates as displayed text
+SHEET_READ_PARAMS = {"valueRenderOption": "UNFORMATTED_VALUE", "dateTimeRenderOption": "FORMATTED_STRING"}
 
 # --- CONNECTION WITH CACHING ---
-conn = st.connection("gsheets", type=GSheetsConnection)
+@st.cache_resource
+def get_conn():
+    return st.connection("gsheets", type=GSheetsConnection)
+
+conn = get_conn()
+
+# Raw gspread handle for batched calls conn.read/conn.update can't express
+@st.cache_resource
+def get_spreadsheet():
+    return conn._instance._open_spreadsheet()
+
+def values_to_frame(value_range):
+    values = value_range.get("values", [])
+    if not values:
+        return pd.DataFrame()
+    # Rows fitted to the header's width; the index is the sheet row, so resolved rows can be deleted in place
+    header = values[0]
+    n = len(header)
+    rows = [row[:n] + [""] * (n - len(row)) for row in values[1:]]
+    df = pd.DataFrame(rows, columns=header, index=pd.RangeIndex(1, len(values)), dtype="string[pyarrow]")
+    return df.replace("", np.nan).dropna(how="all")
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_sheets():
+    result = get_spreadsheet().values_batch_get(["transactions!A:Z", "pending!A:Z"], params=SHEET_READ_PARAMS)
+    df_ledger, df_pending = (values_to_frame(vr) for vr in result["valueRanges"])
+    df_ledger = normalize_dataframe(df_ledger, "transactions").sort_values('last_updated', kind='stable', ignore_index=True)
+    df_ledger = df_ledger.convert_dtypes(dtype_backend='pyarrow')
+    # Via float64: an all-whole-dollar column comes back int64, which can't cast to decimal(12, 2)
+    df_ledger['total_won'] = df_ledger['total_won'].astype('float64').round(2).astype(LEDGER_MONEY)
+    # Sorted categories double as the sportsbook picker list
+    df_ledger['book'] = pd.Categorical(df_ledger['book'], categories=sorted(df_ledger['book'].dropna().unique()))
+    df_ledger['timeframe_type'] = df_ledger['timeframe_type'].astype('category')
+    df_pending = normalize_dataframe(df_pending, "pending")
+    df_pending['status'] = df_pending['status'].astype('category')
+    # Cache key for dashboard_stats/chart_spec
+    ledger_token = int(pd.util.hash_pandas_object(df_ledger[['event_date', 'total_won']], index=False).sum())
+    return df_ledger, df_pending, ledger_token
+
+@st.cache_resource
+def get_sheet_ids():
+    return {ws.title: ws.id for ws in get_spreadsheet().worksheets()}
+
+# One pass to the Sheets wire format; NaN/NaT become "" since JSON can't carry them
+def df_to_values(df, header=True):
+    df = df.assign(**{col: df[col].dt.strftime(fmt) for col, fmt in SHEET_DATETIME_FORMATS.items()
+                      if col in df and pd.api.types.is_datetime64_any_dtype(df[col])})
+    rows = df.astype(object).where(df.notna(), "").values.tolist()
+    return [df.columns.tolist()] + rows if header else rows
+
+def to_cell(value):
+    # Mirrors valueInputOption=RAW: numbers stay numbers, everything else is a literal string
+    if value == "":
+        return {}
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {"userEnteredValue": {"numberValue": value}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
+
+def to_rows(values):
+    return [{"values": [to_cell(v) for v in row]} for row in values]
+
+def append_request(worksheet, df):
+    return {"appendCells": {"sheetId": get_sheet_ids()[worksheet], "rows": to_rows(df_to_values(df, header=False)), "fields": "userEnteredValue"}}
+
+def rewrite_request(worksheet, df):
+    values = df_to_values(df)
+    start = {"sheetId": get_sheet_ids()[worksheet], "rowIndex": 0, "columnIndex": 0}
+    return {"updateCells": {"start": start, "rows": to_rows(values), "fields": "userEnteredValue"}}
+
+def add_rows_request(worksheet, df_existing, df_new):
+    # Only the new rows go over the wire; an empty sheet may lack its header, so it's written from A1
+    if df_existing.empty:
+        return rewrite_request(worksheet, df_new)
+    return append_request(worksheet, df_new.reindex(columns=df_existing.columns))
 
-@st.cache_data(ttl=300)
-def fetch_data(worksheet):
-    df = conn.read(worksheet=worksheet, ttl=0)
-    return normalize_dataframe(df, worksheet)
+def delete_rows_requests(worksheet, row_indices):
+    # Bottom-up so each deletion leaves the sheet rows of the ones still queued unshifted
+    sheet_id = get_sheet_ids()[worksheet]
+    return [{"deleteDimension": {"range": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": i, "endIndex": i + 1}}}
+            for i in sorted(row_indices, reverse=True)]
+
+PENDING_KEY = ["event_date", "book", "amount_risked", "odds"]
+
+def pending_rows_unchanged(df_targets):
+    # Row positions come from a load that may be minutes old; re-read right before deleting so a sheet
+    # edited, sorted or resolved elsewhere in the meantime aborts the write instead of deleting other bets
+    expected = df_targets[PENDING_KEY].astype(str).values.tolist()
+    def verify(spreadsheet):
+        current = normalize_dataframe(values_to_frame(spreadsheet.values_get("pending!A:Z", params=SHEET_READ_PARAMS)), "pending")
+        if current.reindex(df_targets.index)[PENDING_KEY].astype(str).values.tolist() != expected:
+            raise ValueError("Pending sheet changed since it was loaded; nothing was deleted, resolve again")
+    return verify
+
+def batch_write(requests, verify=None):
+    # Every request, across worksheets, goes out in one spreadsheets.batchUpdate call; a failed verify skips it
+    spreadsheet = get_spreadsheet()
+    if verify is not None:
+        verify(spreadsheet)
+    spreadsheet.batch_update({"requests": requests})
+    load_sheets.clear()
 
 try:
-    df_ledger = fetch_data("transactions")
-    df_pending = fetch_data("pending")
+    df_ledger, df_pending, ledger_token = load_sheets()
 except Exception as e:
     st.error(f"Connection Error: {e}")
     st.stop()
 
 # --- CALCULATIONS ---
-existing_books = sorted(df_ledger['book'].unique().tolist()) if not df_ledger.empty else ["Draftkings", "Fanduel", "Rebet"]
+existing_books = df_ledger['book'].cat.categories.tolist() if not df_ledger.empty else ["Draftkings", "Fanduel", "Rebet"]
+
+# Keyed on the loader's content token; the leading underscore keeps Streamlit from hashing the frame
+@st.cache_data(show_spinner=False, max_entries=12)
+def dashboard_stats(ledger_token, year, month, _df):
+    event_dates = _df['event_date']
+    # Truncate to calendar month on the raw datetime64 buffer: one compare instead of two .dt extracts
+    in_month = event_dates.to_numpy().astype('datetime64[M]') == np.datetime64(f"{year}-{month:02d}", 'M')
+    month_won = _df['total_won'][in_month]
+    monthly_pnl = month_won.sum()
+    if not in_month.any():
+        return pd.DataFrame(), monthly_pnl, _df['total_won'].sum()
+    # At most 31 distinct days: sort once and sum runs of equal dates with reduceat instead of a hash groupby
+    dates = event_dates.to_numpy()[in_month]
+    order = np.argsort(dates, kind='stable')
+    dates, won = dates[order], month_won.to_numpy(dtype=float)[order]
+    day_starts = np.r_[0, np.flatnonzero(dates[1:] != dates[:-1]) + 1]
+    day_sums = np.add.reduceat(won, day_starts)
+    daily_totals = pd.DataFrame({'event_date': dates[day_starts], 'total_won': day_sums, 'cumulative_pnl': np.cumsum(day_sums)})
+    return daily_totals, monthly_pnl, _df['total_won'].sum()
 
 if not df_ledger.empty:
-    df_calc = df_ledger.copy()
-    df_calc['event_date'] = pd.to_datetime(df_calc['event_date'])
-    all_time_pnl = df_ledger['total_won'].sum()
-    df_month = df_calc[(df_calc['event_date'].dt.month == now_local.month) & (df_calc['event_date'].dt.year == now_local.year)].copy()
-    monthly_pnl = df_month['total_won'].sum()
-    daily_totals = df_month.groupby('event_date')['total_won'].sum().reset_index().sort_values('event_date')
-    daily_totals['cumulative_pnl'] = daily_totals['total_won'].cumsum()
+    daily_totals, monthly_pnl, all_time_pnl = dashboard_stats(ledger_token, now_local.year, now_local.month, df_ledger)
 else:
     daily_totals, monthly_pnl, all_time_pnl = pd.DataFrame(), 0.0, 0.0
 
 # --- UI DISPLAY: KPI PILLS ---
 st.title("💰 Bet Management")
 
+# Static markup built once; each pill only fills in its label, colors and amount
+KPI_PILL_HTML = """
+    <div style="margin-bottom: 20px;">
+        <p style="margin: 0; font-size: 0.9rem; color: #808495; font-weight: 500;">{label}</p>
+        <div style="
+            display: inline-block;
+            background-color: {bg_color};
+            color: {text_color};
+            padding: 6px 18px;
+            border-radius: 12px;
+            font-weight: 700;
+            font-size: 1.5rem;
+            margin-top: 6px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        ">
+            {prefix}${amount:,.2f}
+        </div>
+    </div>
+"""
+
 def kpi_pill(label, amount):
     bg_color = "#2e7d32" if amount >= 0 else "#d32f2f" 
-    text_color = "#ffffff"
     prefix = "+" if amount >= 0 else ""
-    
-    st.markdown(f"""
-        <div style="margin-bottom: 20px;">
-            <p style="margin: 0; font-size: 0.9rem; color: #808495; font-weight: 500;">{label}</p>
-            <div style="
-                display: inline-block;
-                background-color: {bg_color};
-                color: {text_color};
-                padding: 6px 18px;
-                border-radius: 12px;
-                font-weight: 700;
-                font-size: 1.5rem;
-                margin-top: 6px;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            ">
-                {prefix}${amount:,.2f}
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(KPI_PILL_HTML.format(label=label, bg_color=bg_color, text_color="#ffffff", prefix=prefix, amount=amount),
+                unsafe_allow_html=True)
 
 col_kpi1, col_kpi2 = st.columns(2)
 with col_kpi1:
@@ -109,39 +239,89 @@ with col_kpi2:
     kpi_pill(f"{now_local.strftime('%B')} PnL", monthly_pnl)
 
 # Cumulative Chart
-if not daily_totals.empty:
-    pnl_color = "#2e7d32" if monthly_pnl >= 0 else "#d32f2f"
-    line = alt.Chart(daily_totals).mark_line(point=True, color=pnl_color).encode(
+# The compiled Vega-Lite spec shares dashboard_stats' key, so Altair only rebuilds it when the ledger changes
+@st.cache_data(show_spinner=False, max_entries=12)
+def chart_spec(ledger_token, year, month, pnl_color, _daily_totals):
+    # Only the plotted columns are inlined into the spec; total_won never reaches the browser
+    return alt.Chart(_daily_totals[['event_date', 'cumulative_pnl']]).mark_line(point=True, color=pnl_color).encode(
         x=alt.X('event_date:T', title='Date'),
         y=alt.Y('cumulative_pnl:Q', title='Cumulative PnL ($)'),
-        tooltip=['event_date', 'cumulative_pnl']
-    ).properties(height=250)
-    st.altair_chart(line, width="stretch")
+        tooltip=['event_date:T', 'cumulative_pnl:Q']
+    ).properties(height=250).to_dict()
+
+if not daily_totals.empty:
+    pnl_color = "#2e7d32" if monthly_pnl >= 0 else "#d32f2f"
+    st.vega_lite_chart(spec=chart_spec(ledger_token, now_local.year, now_local.month, pnl_color, daily_totals), width="stretch")
+
+# --- STAGING HELPERS ---
+def now_str():
+    return datetime.now(local_tz).strftime('%Y-%m-%d %H:%M:%S')
+
+def stage_ledger_row(event_date, book, total_won, timeframe_type="single"):
+    st.session_state.staged_bets.append({
+        "event_date": event_date, "book": book, "timeframe_type": timeframe_type,
+        "total_won": float(total_won),
+        "last_updated": now_str()
+    })
+
+def staged_frame(key):
+    # Rebuilt only when the queue list is replaced or grows; queues are append-only between flushes
+    rows = st.session_state[key]
+    cached = st.session_state.get(f"{key}_frame")
+    if cached is None or cached[0] is not rows or len(cached[1]) != len(rows):
+        cached = (rows, pd.DataFrame(rows))
+        st.session_state[f"{key}_frame"] = cached
+    return cached[1]
+
+def stage_pending_row(event_date, book, risk, odds):
+    st.session_state.staged_pending.append({
+        "event_date": event_date, "book": book,
+        "amount_risked": float(risk), "odds": int(odds),
+        "potential_pnl": float(calc_pnl(risk, odds)), "status": "pending"
+    })
 
 # --- STAGING AREA ---
-if st.session_state.staged_bets:
+# New rows are buffered as plain dicts and flushed with a single concat per sheet on commit
+if st.session_state.staged_bets or st.session_state.staged_pending:
     with st.container(border=True):
         st.subheader("📋 Staging Queue")
-        df_stage = pd.DataFrame(st.session_state.staged_bets)
-        st.dataframe(df_stage, width="stretch", hide_index=True)
+        if st.session_state.staged_bets:
+            df_stage = staged_frame("staged_bets")
+            st.dataframe(df_stage, width="stretch", hide_index=True)
+        if st.session_state.staged_pending:
+            st.caption("Pending Sweats")
+            df_stage_pending = staged_frame("staged_pending")
+            st.dataframe(df_stage_pending, width="stretch", hide_index=True)
         
         q_c1, q_c2 = st.columns([1, 5])
         if q_c1.button("🚀 Commit to Ledger", type="primary", width="stretch"):
             with st.spinner("Batch writing..."):
-                final_df = pd.concat([df_ledger, df_stage], ignore_index=True)
-                conn.update(worksheet="transactions", data=normalize_dataframe(final_df))
-                st.session_state.staged_bets = []
-                st.cache_data.clear()
-                st.rerun()
+                requests = []
+                if st.session_state.staged_bets:
+                    requests.append(add_rows_request("transactions", df_ledger, normalize_dataframe(df_stage)))
+                if st.session_state.staged_pending:
+                    requests.append(add_rows_request("pending", df_pending, normalize_dataframe(df_stage_pending, "pending")))
+                try:
+                    batch_write(requests)
+                except Exception as e:
+                    # The queue is only cleared once the write lands, so a failure leaves it intact to retry
+                    st.error(f"Save Error: {e}")
+                else:
+                    st.session_state.staged_bets = []
+                    st.session_state.staged_pending = []
+                    st.rerun()
         if q_c2.button("🗑️ Clear Queue"):
             st.session_state.staged_bets = []
+            st.session_state.staged_pending = []
             st.rerun()
 
 st.divider()
 tab_bulk, tab_bet, tab_pending = st.tabs(["📊 Bulk PnL", "🎯 Single Bet", "⏳ Pending Sweats"])
 
 # TAB 1: BULK PNL
-with tab_bulk:
+# Each tab body is a fragment, so edits inside it (e.g. the resolution editor) rerun only that tab
+@st.fragment
+def bulk_pnl_tab(existing_books):
     with st.form("bulk_pnl_form", border=True):
         ca, cb = st.columns(2)
         with ca:
@@ -153,16 +333,15 @@ with tab_bulk:
         
         if st.form_submit_button("Add to Queue", width="stretch"):
             if b_book and b_pnl != 0:
-                st.session_state.staged_bets.append({
-                    "event_date": b_date.strftime('%Y-%m-%d'),
-                    "book": b_book, "timeframe_type": b_type,
-                    "total_won": float(b_pnl),
-                    "last_updated": datetime.now(local_tz).strftime('%Y-%m-%d %H:%M:%S')
-                })
+                stage_ledger_row(b_date.strftime('%Y-%m-%d'), b_book, b_pnl, b_type)
                 st.rerun()
 
+with tab_bulk:
+    bulk_pnl_tab(existing_books)
+
 # TAB 2: SINGLE BET
-with tab_bet:
+@st.fragment
+def single_bet_tab(existing_books):
     with st.form("single_bet_form", border=True):
         col1, col2 = st.columns(2)
         with col1:
@@ -175,37 +354,30 @@ with tab_bet:
         sb_c1, sb_c2, sb_c3 = st.columns(3)
         win_submit = sb_c1.form_submit_button("✅ Win (Stage)", width="stretch")
         loss_submit = sb_c2.form_submit_button("❌ Loss (Stage)", width="stretch")
-        pend_submit = sb_c3.form_submit_button("⏳ Pending (Direct)", width="stretch")
+        pend_submit = sb_c3.form_submit_button("⏳ Pending (Stage)", width="stretch")
 
         if win_submit or loss_submit or pend_submit:
             if sb_book and sb_risk > 0:
-                p_win = calc_pnl(sb_risk, sb_odds)
+                sb_date_str = sb_date.strftime('%Y-%m-%d')
                 if pend_submit:
-                    new_pending = pd.DataFrame([{
-                        "event_date": sb_date.strftime('%Y-%m-%d'), "book": sb_book,
-                        "amount_risked": float(sb_risk), "odds": int(sb_odds),
-                        "potential_pnl": float(p_win), "status": "pending"
-                    }])
-                    conn.update(worksheet="pending", data=normalize_dataframe(pd.concat([df_pending, new_pending], ignore_index=True), "pending"))
-                    st.cache_data.clear()
-                    st.rerun()
+                    stage_pending_row(sb_date_str, sb_book, sb_risk, sb_odds)
+                elif win_submit:
+                    stage_ledger_row(sb_date_str, sb_book, calc_pnl(sb_risk, sb_odds))
                 else:
-                    final_pnl = float(p_win) if win_submit else -float(sb_risk)
-                    st.session_state.staged_bets.append({
-                        "event_date": sb_date.strftime('%Y-%m-%d'),
-                        "book": sb_book, "timeframe_type": "single",
-                        "total_won": final_pnl,
-                        "last_updated": datetime.now(local_tz).strftime('%Y-%m-%d %H:%M:%S')
-                    })
-                    st.rerun()
+                    stage_ledger_row(sb_date_str, sb_book, -sb_risk)
+                st.rerun()
+
+with tab_bet:
+    single_bet_tab(existing_books)
 
 # TAB 3: PENDING
-with tab_pending:
+@st.fragment
+def pending_tab(df_pending):
     if not df_pending.empty:
         st.subheader("⏳ Resolve Active Sweats")
         
-        df_pending_resolve = df_pending.copy()
-        df_pending_resolve.insert(0, "Resolution", ["---"] * len(df_pending))
+        df_pending_resolve = df_pending.copy(deep=False)
+        df_pending_resolve.insert(0, "Resolution", "---")
         
         resolved_data = st.data_editor(
             df_pending_resolve,
@@ -215,7 +387,8 @@ with tab_pending:
                     # Added "🔄 Void" to the options
                     options=["---", "🏆 Win", "❌ Loss", "🔄 Void"],
                     required=True,
-                )
+                ),
+                "event_date": st.column_config.DateColumn(format="YYYY-MM-DD"),
             },
             disabled=["event_date", "book", "amount_risked", "odds", "potential_pnl", "status"],
             hide_index=True,
@@ -228,45 +401,43 @@ with tab_pending:
             voids = resolved_data[resolved_data["Resolution"] == "🔄 Void"]
             
             if not wins.empty or not losses.empty or not voids.empty:
-                # Handle Wins
-                for _, row in wins.iterrows():
-                    st.session_state.staged_bets.append({
-                        "event_date": row['event_date'],
-                        "book": row['book'],
-                        "timeframe_type": "single",
-                        "total_won": float(row['potential_pnl']),
-                        "last_updated": datetime.now(local_tz).strftime('%Y-%m-%d %H:%M:%S')
-                    })
-                
-                # Handle Losses
-                for _, row in losses.iterrows():
-                    st.session_state.staged_bets.append({
-                        "event_date": row['event_date'],
-                        "book": row['book'],
-                        "timeframe_type": "single",
-                        "total_won": -float(row['amount_risked']),
-                        "last_updated": datetime.now(local_tz).strftime('%Y-%m-%d %H:%M:%S')
-                    })
+                # df_pending is indexed by sheet row, so only the resolved rows are deleted
+                indices_to_remove = resolved_data[resolved_data["Resolution"] != "---"].index
+                with st.spinner("Updating Pending Sweats..."):
+                    try:
+                        batch_write(delete_rows_requests("pending", indices_to_remove),
+                                    verify=pending_rows_unchanged(df_pending.loc[indices_to_remove]))
+                    except Exception as e:
+                        st.error(f"Save Error: {e}")
+                        return
+
+                # Wins pay potential_pnl, losses cost the stake; built column-wise and staged in one extend
+                settled = pd.concat([
+                    wins[["event_date", "book"]].assign(total_won=wins["potential_pnl"]),
+                    losses[["event_date", "book"]].assign(total_won=-losses["amount_risked"]),
+                ])
+                settled = settled.assign(event_date=settled["event_date"].dt.strftime('%Y-%m-%d'),
+                                         timeframe_type="single", last_updated=now_str()).astype({"total_won": float})
+                st.session_state.staged_bets.extend(
+                    settled[["event_date", "book", "timeframe_type", "total_won", "last_updated"]].to_dict("records"))
                 
                 # Note: Void rows are implicitly handled by being included in 'indices_to_remove' 
                 # but NOT added to st.session_state.staged_bets.
 
-                indices_to_remove = resolved_data[resolved_data["Resolution"] != "---"].index
-                df_pending_remaining = df_pending.drop(indices_to_remove)
-                
-                with st.spinner("Updating Pending Sweats..."):
-                    conn.update(worksheet="pending", data=normalize_dataframe(df_pending_remaining, "pending"))
-                    st.cache_data.clear()
+                msg = f"Resolved {len(wins) + len(losses) + len(voids)} bets!"
+                if not voids.empty:
+                    msg += f" ({len(voids)} voided)"
                     
-                    msg = f"Resolved {len(wins) + len(losses) + len(voids)} bets!"
-                    if not voids.empty:
-                        msg += f" ({len(voids)} voided)"
-                        
-                    st.success(msg)
-                    st.rerun()
+                st.success(msg)
+                st.rerun()
     else:
         st.info("No active sweats.")
+
+with tab_pending:
+    pending_tab(df_pending)
+
 st.divider()
 st.subheader("Live Ledger")
 if not df_ledger.empty:
-    st.dataframe(df_ledger.sort_values('last_updated', ascending=False).head(25), width="stretch", hide_index=True)
\ No newline at end of file
+    st.dataframe(df_ledger.tail(25).iloc[::-1], width="stretch", hide_index=True,
+                 column_config={"event_date": st.column_config.DateColumn(format="YYYY-MM-DD")})
\ No newline at end of file